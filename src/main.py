@@ -3,18 +3,25 @@ A beautiful, fast, and feature-rich file organization tool.
 """
 
 import os
+import errno
 import random
 import sys
 import time
 import json
 import shutil
 import logging
+import atexit
+import queue
+import functools
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict, Counter
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from itertools import count
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from dataclasses import dataclass
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 # Third-party imports
 try:
@@ -24,6 +31,7 @@ try:
     from rich.table import Table
     from rich.panel import Panel
     from rich.text import Text
+    from rich.markup import escape
     from rich.prompt import Prompt, Confirm
     from rich.tree import Tree
     from rich.layout import Layout
@@ -34,38 +42,83 @@ except ImportError as e:
     print(f"Missing required packages. Install with: pip install rich questionary")
     sys.exit(1)
 
+# Optional fast JSON encoder for reports
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Initialize rich console
 console = Console()
 
-@dataclass
+# Identifies this run in log and report file names
+_RUN_ID = f"{int(time.time())}_{os.getpid()}"
+
+# Suffix source for renaming duplicate files; unique for the whole run
+_dup_counter = count(1)
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_ts(ts: float) -> str:
+    """Format a raw stat timestamp for display"""
+    return datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S')
+
+@dataclass(slots=True)
 class FileInfo:
     """Enhanced file information structure"""
     name: str
     full_path: str
     size_bytes: int
-    size_human: str
-    created: str
-    modified: str
-    accessed: str
+    created: float
+    modified: float
+    accessed: float
     extension: str
     category: Optional[str] = None
     
+    @property
+    def size_human(self) -> str:
+        return format_bytes(self.size_bytes)
+    
+    @property
+    def created_str(self) -> str:
+        return _fmt_ts(self.created)
+    
+    @property
+    def modified_str(self) -> str:
+        return _fmt_ts(self.modified)
+    
+    @property
+    def accessed_str(self) -> str:
+        return _fmt_ts(self.accessed)
+    
     @classmethod
-    def from_path(cls, file_path: Path) -> 'FileInfo':
-        """Create FileInfo from a Path object"""
-        stats = file_path.stat()
+    def from_dirent(cls, entry: os.DirEntry) -> 'FileInfo':
+        """Create FileInfo from an os.scandir entry, reusing its cached metadata"""
+        stats = entry.stat()
         return cls(
-            name=file_path.name,
-            full_path=str(file_path),
+            name=entry.name,
+            full_path=entry.path,
             size_bytes=stats.st_size,
-            size_human=format_bytes(stats.st_size),
-            created=datetime.fromtimestamp(stats.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
-            modified=datetime.fromtimestamp(stats.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-            accessed=datetime.fromtimestamp(stats.st_atime).strftime('%Y-%m-%d %H:%M:%S'),
-            extension=file_path.suffix.lower().lstrip('.')
+            created=stats.st_ctime,
+            modified=stats.st_mtime,
+            accessed=stats.st_atime,
+            extension=os.path.splitext(entry.name)[1].lower().lstrip('.')
         )
+    
+    def to_dict(self) -> dict:
+        """Serializable form with human readable size and timestamps"""
+        return {
+            "name": self.name,
+            "full_path": self.full_path,
+            "size_bytes": self.size_bytes,
+            "size_human": self.size_human,
+            "created": self.created_str,
+            "modified": self.modified_str,
+            "accessed": self.accessed_str,
+            "extension": self.extension,
+            "category": self.category
+        }
 
-@dataclass 
+@dataclass(slots=True)
 class OrganizationResult:
     """Results of the organization process"""
     total_files: int
@@ -75,6 +128,18 @@ class OrganizationResult:
     total_size: int
     processing_time: float
     files_by_category: Dict[str, List[FileInfo]]
+    
+    def to_dict(self) -> dict:
+        """Report form; FileInfo entries are left for write_json to encode one at a time"""
+        return {
+            "total_files": self.total_files,
+            "organized_files": self.organized_files,
+            "skipped_files": self.skipped_files,
+            "categories_created": list(self.categories_created),
+            "total_size": self.total_size,
+            "processing_time": self.processing_time,
+            "files_by_category": self.files_by_category
+        }
 
 
 FILE_CATEGORIES = {
@@ -240,32 +305,97 @@ FILE_CATEGORIES = {
     "❓ Misc": []  # Fallback category
 }
 
+# Static lookup data: frozensets give O(1) membership and drop duplicate entries.
+# Category names are interned so every FileInfo shares the same string objects.
+FILE_CATEGORIES: Dict[str, FrozenSet[str]] = {
+    sys.intern(category): frozenset(extensions) for category, extensions in FILE_CATEGORIES.items()
+}
+
+def build_extension_index(categories: Dict[str, FrozenSet[str]]) -> Dict[str, List[str]]:
+    """Map each extension to the categories that claim it, in category order"""
+    index = defaultdict(list)
+    for category, extensions in categories.items():
+        for extension in extensions:
+            index[extension].append(category)
+    return dict(index)
+
+# Built once at import so categorization is a single dict lookup per file
+EXT_INDEX: Dict[str, List[str]] = build_extension_index(FILE_CATEGORIES)
+SINGLE_CAT: Dict[str, str] = {ext: cats[0] for ext, cats in EXT_INDEX.items() if len(cats) == 1}
+
+# Folder name for each category (emoji prefix removed)
+CATEGORY_FOLDER_NAME: Dict[str, str] = {category: category.split()[-1] for category in FILE_CATEGORIES}
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+@functools.lru_cache(maxsize=8192)
 def format_bytes(bytes_value: int) -> str:
     """Convert bytes to human readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.1f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.1f} PB"
+    # Each unit spans 10 bits, so the bit length picks the unit without a loop
+    unit_idx = min(max(0, (bytes_value.bit_length() - 1) // 10), len(_BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (10 * unit_idx)):.1f} {_BYTE_UNITS[unit_idx]}"
+
+def _json_default(obj):
+    """Encode values the stdlib json module does not handle natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_json(data) -> bytes:
+    """Serialize data to indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+def write_json(f, value, level: int = 0):
+    """Write value to a binary file as indented JSON, one container element at a time
+    
+    Only a single FileInfo (or scalar) is ever encoded at once, so memory stays
+    bounded no matter how many files the report covers.
+    """
+    indent = b'  ' * level
+    if isinstance(value, dict) and value:
+        f.write(b'{')
+        for i, (key, item) in enumerate(value.items()):
+            f.write((b',\n' if i else b'\n') + indent + b'  ' + dumps_json(str(key)) + b': ')
+            write_json(f, item, level + 1)
+        f.write(b'\n' + indent + b'}')
+    elif isinstance(value, list) and value:
+        f.write(b'[')
+        for i, item in enumerate(value):
+            f.write((b',\n' if i else b'\n') + indent + b'  ')
+            write_json(f, item, level + 1)
+        f.write(b'\n' + indent + b']')
+    else:
+        if isinstance(value, FileInfo):
+            value = value.to_dict()
+        # JSON strings never contain raw newlines, so this only re-indents structure
+        f.write(dumps_json(value).replace(b'\n', b'\n' + indent))
 
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
     """Setup logging configuration"""
     log_dir = Path.home() / ".autocleaner" / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
     
-    log_file = log_dir / f"autocleaner_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    log_file = log_dir / f"autocleaner_{_RUN_ID}.log"
+    
+    # File writes happen on a listener thread so scanning never blocks on log I/O
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.FileHandler(log_file, encoding='utf-8'))
+    listener.start()
+    atexit.register(listener.stop)
     
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(log_file),
+            QueueHandler(log_queue),
             logging.StreamHandler()
         ]
     )
     
     logger = logging.getLogger('AutoClean')
-    logger.info(f"Logging initialized. Log file: {log_file}")
+    logger.info("Logging initialized. Log file: %s", log_file)
     return logger
 
 class EnhancedAutoClean:
@@ -277,18 +407,28 @@ class EnhancedAutoClean:
                  auto_organize: bool = False,
                  create_backup: bool = True,
                  delete_empty: bool = False,
-                 log_level: str = "INFO"):
+                 log_level: str = "INFO",
+                 stat_threads: Optional[int] = None,
+                 resolve_symlinks: bool = False,
+                 move_threads: Optional[int] = None):
         
-        self.folder_paths = [Path(path).resolve() for path in folder_paths]
+        # abspath is purely lexical; resolve() stats every path component
+        if resolve_symlinks:
+            self.folder_paths = [Path(path).resolve() for path in folder_paths]
+        else:
+            self.folder_paths = [Path(os.path.abspath(path)) for path in folder_paths]
+        self._folder_paths_str = [str(p) for p in self.folder_paths]
         self.dry_run = dry_run
         self.auto_organize = auto_organize
         self.create_backup = create_backup
         self.delete_empty = delete_empty
+        self.stat_threads = min(32, (os.cpu_count() or 1) * 4) if stat_threads is None else stat_threads
+        self.move_threads = max(4, os.cpu_count() or 1) if move_threads is None else move_threads
         self.logger = setup_logging(log_level)
         
         # Data storage
-        self.files_data: Dict[str, List[FileInfo]] = defaultdict(list)
-        self.categorized_files: Dict[str, Dict[str, List[FileInfo]]] = defaultdict(lambda: defaultdict(list))
+        self.files_data: Dict[str, List[FileInfo]] = {}
+        self.categorized_files: Dict[str, Dict[str, List[FileInfo]]] = {}
         self.results: List[OrganizationResult] = []
         
         # Validate paths
@@ -300,9 +440,17 @@ class EnhancedAutoClean:
         if invalid_paths:
             console.print(f"[bold red]Error:[/bold red] The following paths don't exist:")
             for path in invalid_paths:
-                console.print(f"  • {path}")
+                console.print(f"  • {path}", highlight=False, markup=False, soft_wrap=True)
             sys.exit(1)
     
+    def _stat_file(self, entry: os.DirEntry) -> Optional[FileInfo]:
+        """Build FileInfo for a single file, logging and skipping unreadable ones"""
+        try:
+            return FileInfo.from_dirent(entry)
+        except (OSError, PermissionError) as e:
+            self.logger.warning("Could not access file %s: %s", entry.path, e)
+            return None
+    
     def scan_files(self) -> Dict[str, List[FileInfo]]:
         """Scan all files in the provided directories"""
         console.print("[bold blue]🔍 Scanning files...[/bold blue]")
@@ -315,27 +463,27 @@ class EnhancedAutoClean:
             TimeRemainingColumn(),
             console=console,
             transient=True
-        ) as progress:
+        ) as progress, ThreadPoolExecutor(max_workers=self.stat_threads) as executor:
             
             for folder_path in self.folder_paths:
                 folder_str = str(folder_path)
-                task = progress.add_task(f"Scanning {folder_path.name}...", total=None)
+                task = progress.add_task(f"Scanning {escape(folder_path.name)}...", total=None)
                 
                 try:
-                    files = [f for f in folder_path.iterdir() if f.is_file()]
-                    progress.update(task, total=len(files))
+                    with os.scandir(folder_path) as it:
+                        files = [e for e in it if e.is_file(follow_symlinks=False)]
+                    
+                    # stat() calls run concurrently to hide per-file syscall latency
+                    self.files_data[folder_str] = [
+                        file_info
+                        for file_info in progress.track(
+                            executor.map(self._stat_file, files), total=len(files), task_id=task
+                        )
+                        if file_info is not None
+                    ]
                     
-                    for file_path in files:
-                        try:
-                            file_info = FileInfo.from_path(file_path)
-                            self.files_data[folder_str].append(file_info)
-                            progress.advance(task)
-                        except (OSError, PermissionError) as e:
-                            self.logger.warning(f"Could not access file {file_path}: {e}")
-                            continue
-                            
                 except (OSError, PermissionError) as e:
-                    self.logger.error(f"Could not access directory {folder_path}: {e}")
+                    self.logger.error("Could not access directory %s: %s", folder_path, e)
                     continue
         
         total_files = sum(len(files) for files in self.files_data.values())
@@ -350,25 +498,28 @@ class EnhancedAutoClean:
         ambiguous_files = defaultdict(list)
         
         for folder_path, files in self.files_data.items():
+            if not files:
+                continue
+            
+            # Every known category gets a list up front; no nested defaultdicts
+            folder_categories = self.categorized_files.setdefault(
+                folder_path, {category: [] for category in FILE_CATEGORIES}
+            )
+            
             for file_info in files:
-                matching_categories = []
-                
-                # Find all matching categories
-                for category, extensions in FILE_CATEGORIES.items():
-                    if file_info.extension in extensions:
-                        matching_categories.append(category)
+                category = SINGLE_CAT.get(file_info.extension)
                 
-                if len(matching_categories) == 1:
+                if category is not None:
                     # Single match - auto-categorize
-                    file_info.category = matching_categories[0]
-                    self.categorized_files[folder_path][matching_categories[0]].append(file_info)
-                elif len(matching_categories) > 1:
+                    file_info.category = category
+                    folder_categories[category].append(file_info)
+                elif file_info.extension in EXT_INDEX:
                     # Multiple matches - need user input
-                    ambiguous_files[folder_path].append((file_info, matching_categories))
+                    ambiguous_files[folder_path].append((file_info, EXT_INDEX[file_info.extension]))
                 else:
                     # No matches - put in Misc
                     file_info.category = "❓ Misc"
-                    self.categorized_files[folder_path]["❓ Misc"].append(file_info)
+                    folder_categories["❓ Misc"].append(file_info)
         
         # Handle ambiguous files
         if ambiguous_files and not self.auto_organize:
@@ -376,6 +527,10 @@ class EnhancedAutoClean:
         elif ambiguous_files and self.auto_organize:
             self._auto_resolve_ambiguous_files(ambiguous_files)
         
+        # Drop folders left with nothing to organize (e.g. every file was skipped)
+        for folder_path in [f for f, categories in self.categorized_files.items() if not any(categories.values())]:
+            del self.categorized_files[folder_path]
+        
         return self.categorized_files
 
     def _resolve_ambiguous_files(self, ambiguous_files: Dict[str, List[Tuple[FileInfo, List[str]]]]):
@@ -396,7 +551,9 @@ class EnhancedAutoClean:
         ])
         
         for folder_path, ambiguous_list in ambiguous_files.items():
-            console.print(f"\n[bold cyan]📁 {Path(folder_path).name}[/bold cyan]")
+            console.print(
+                f"\n📁 {Path(folder_path).name}", style="bold cyan", highlight=False, markup=False, soft_wrap=True
+            )
             
             for file_info, categories in ambiguous_list:
                 choice = questionary.select(
@@ -406,6 +563,7 @@ class EnhancedAutoClean:
                 ).ask()
                 
                 if choice and choice != "⏭️ Skip this file":
+                    choice = sys.intern(choice)
                     file_info.category = choice
                     self.categorized_files[folder_path][choice].append(file_info)
 
@@ -420,7 +578,7 @@ class EnhancedAutoClean:
                     chosen_category = random.choice(categories) # Pick random one
                 file_info.category = chosen_category
                 self.categorized_files[folder_path][chosen_category].append(file_info)
-                self.logger.info(f"Auto-resolved {file_info.name} to category {chosen_category}")
+                self.logger.info("Auto-resolved %s to category %s", file_info.name, chosen_category)
 
     def display_organization_preview(self):
         """Display a preview of the planned organization"""
@@ -430,7 +588,7 @@ class EnhancedAutoClean:
             folder_name = Path(folder_path).name
             
             # Create a tree view
-            tree = Tree(f"📁 [bold cyan]{folder_name}[/bold cyan]")
+            tree = Tree(Text.assemble("📁 ", (folder_name, "bold cyan")))
             
             total_files = 0
             total_size = 0
@@ -446,7 +604,8 @@ class EnhancedAutoClean:
                 
                 # Show a few example files
                 for file_info in files[:3]:
-                    category_node.add(f"📄 {file_info.name} ({file_info.size_human})")
+                    # Text nodes are not markup-parsed, so names like "x[red].pdf" show as-is
+                    category_node.add(Text(f"📄 {file_info.name} ({file_info.size_human})"))
                 
                 if len(files) > 3:
                     category_node.add(f"... and {len(files) - 3} more files")
@@ -457,6 +616,22 @@ class EnhancedAutoClean:
             tree.add(f"[bold]Total: {total_files} files, {format_bytes(total_size)}[/bold]")
             console.print(tree)
 
+    def _move_file(self, move: Tuple[FileInfo, str, Path]) -> Tuple[FileInfo, str, Optional[Exception]]:
+        """Move one planned file, returning the error instead of raising"""
+        file_info, category, dest_path = move
+        try:
+            try:
+                # Category folders live under the source folder, so a plain rename suffices
+                os.replace(file_info.full_path, dest_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(file_info.full_path, str(dest_path))
+            file_info.full_path = str(dest_path)
+            return file_info, category, None
+        except Exception as e:
+            return file_info, category, e
+
     def organize_files(self):
         """Organize files into category folders"""
         if not self.categorized_files:
@@ -485,57 +660,62 @@ class EnhancedAutoClean:
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeRemainingColumn(),
             console=console
-        ) as progress:
+        ) as progress, ThreadPoolExecutor(max_workers=self.move_threads) as executor:
             
             for folder_path, categories in self.categorized_files.items():
                 base_path = Path(folder_path)
                 
                 # Calculate total files for this folder
                 total_files = sum(len(files) for files in categories.values())
-                task = progress.add_task(f"Organizing {base_path.name}...", total=total_files)
+                task = progress.add_task(f"Organizing {escape(base_path.name)}...", total=total_files)
                 
                 organized_files = 0
                 skipped_files = 0
                 categories_created = []
                 files_by_category = defaultdict(list)
+                moves = []
+                claimed = set()
                 
                 for category, files in categories.items():
                     if not files:
                         continue
                     
                     # Create category folder
-                    category_folder = base_path / category.split()[-1]  # Remove emoji for folder name
+                    category_folder = base_path / CATEGORY_FOLDER_NAME[category]
                     
                     if not self.dry_run:
                         category_folder.mkdir(exist_ok=True)
                         if category not in categories_created:
                             categories_created.append(category)
                     
-                    # Move files
+                    # Plan destinations up front so moves can run in parallel
                     for file_info in files:
-                        try:
-                            source_path = Path(file_info.full_path)
-                            dest_path = category_folder / file_info.name
-                            
-                            if not self.dry_run:
-                                if dest_path.exists():
-                                    # Handle duplicates by adding timestamp
-                                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                                    stem = dest_path.stem
-                                    suffix = dest_path.suffix
-                                    dest_path = category_folder / f"{stem}_{timestamp}{suffix}"
-                                
-                                shutil.move(str(source_path), str(dest_path))
-                                file_info.full_path = str(dest_path)
-                            
-                            files_by_category[category].append(file_info)
-                            organized_files += 1
-                            
-                        except Exception as e:
-                            self.logger.error(f"Failed to move {file_info.name}: {e}")
-                            skipped_files += 1
+                        dest_path = category_folder / file_info.name
+                        
+                        if not self.dry_run and (dest_path in claimed or os.path.lexists(dest_path)):
+                            # Handle duplicates by adding a counter suffix
+                            stem = dest_path.stem
+                            suffix = dest_path.suffix
+                            while dest_path in claimed or os.path.lexists(dest_path):
+                                dest_path = category_folder / f"{stem}_{next(_dup_counter)}{suffix}"
                         
-                        progress.advance(task)
+                        claimed.add(dest_path)
+                        moves.append((file_info, category, dest_path))
+                
+                if self.dry_run:
+                    results = ((file_info, category, None) for file_info, category, _ in moves)
+                else:
+                    results = executor.map(self._move_file, moves)
+                
+                for file_info, category, error in results:
+                    if error is None:
+                        files_by_category[category].append(file_info)
+                        organized_files += 1
+                    else:
+                        self.logger.error("Failed to move %s: %s", file_info.name, error)
+                        skipped_files += 1
+                    
+                    progress.advance(task)
                 
                 # Store results
                 processing_time = time.time() - start_time
@@ -562,11 +742,18 @@ class EnhancedAutoClean:
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="green")
         
-        total_files = sum(r.total_files for r in self.results)
-        total_organized = sum(r.organized_files for r in self.results)
-        total_skipped = sum(r.skipped_files for r in self.results)
-        total_size = sum(r.total_size for r in self.results)
-        avg_processing_time = sum(r.processing_time for r in self.results) / len(self.results)
+        # Aggregate totals and category counts in a single pass over the results
+        total_files = total_organized = total_skipped = total_size = 0
+        total_processing_time = 0.0
+        all_categories = Counter()
+        for result in self.results:
+            total_files += result.total_files
+            total_organized += result.organized_files
+            total_skipped += result.skipped_files
+            total_size += result.total_size
+            total_processing_time += result.processing_time
+            all_categories.update({category: len(files) for category, files in result.files_by_category.items()})
+        avg_processing_time = total_processing_time / len(self.results)
         
         table.add_row("Total Files Processed", str(total_files))
         table.add_row("Files Organized", str(total_organized))
@@ -581,11 +768,6 @@ class EnhancedAutoClean:
         if self.results:
             console.print("\n[bold blue]📁 Category Breakdown[/bold blue]")
             
-            all_categories = Counter()
-            for result in self.results:
-                for category, files in result.files_by_category.items():
-                    all_categories[category] += len(files)
-            
             category_table = Table(show_header=True, header_style="bold magenta")
             category_table.add_column("Category", style="cyan")
             category_table.add_column("Files", style="green", justify="right")
@@ -598,31 +780,33 @@ class EnhancedAutoClean:
             console.print(category_table)
 
     def save_report(self, output_path: Optional[str] = None):
-        """Save organization report to JSON file"""
+        """Save organization report to JSON file, streaming it file entry by file entry"""
         if not self.results:
             return
         
         if output_path is None:
             report_dir = Path.home() / ".autocleaner" / "reports"
             report_dir.mkdir(parents=True, exist_ok=True)
-            output_path = report_dir / f"organization_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            output_path = report_dir / f"organization_report_{_RUN_ID}.json"
         
         report_data = {
-            "timestamp": datetime.now().isoformat(),
-            "folder_paths": [str(p) for p in self.folder_paths],
+            "timestamp": datetime.now(),
+            "folder_paths": self._folder_paths_str,
             "settings": {
                 "dry_run": self.dry_run,
                 "auto_organize": self.auto_organize,
                 "create_backup": self.create_backup,
                 "delete_empty": self.delete_empty
             },
-            "results": [asdict(result) for result in self.results]
+            "results": [result.to_dict() for result in self.results]
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+        # 1 MiB buffer coalesces the per-entry writes into few syscalls
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            write_json(f, report_data)
+            f.write(b'\n')
         
-        console.print(f"[green]💾 Report saved to: {output_path}[/green]")
+        console.print(f"💾 Report saved to: {output_path}", style="green", highlight=False, markup=False, soft_wrap=True)
 
     def cleanup_empty_folders(self):
         """Remove empty folders after organization"""
@@ -633,17 +817,24 @@ class EnhancedAutoClean:
         
         removed_count = 0
         for folder_path in self.folder_paths:
-            for root, dirs, files in os.walk(folder_path, topdown=False):
-                for dir_name in dirs:
-                    dir_path = Path(root) / dir_name
-                    try:
-                        if not any(dir_path.iterdir()):  # Empty directory
-                            if not self.dry_run:
-                                dir_path.rmdir()
-                            removed_count += 1
-                            self.logger.info(f"Removed empty directory: {dir_path}")
-                    except OSError:
-                        continue
+            top = str(folder_path)
+            removed = set()
+            
+            # The walk already lists each directory, so emptiness needs no extra listing.
+            # dirs is read before children are visited, so track what was removed below.
+            for root, dirs, files in os.walk(top, topdown=False):
+                if root == top or files:
+                    continue
+                if any(os.path.join(root, dir_name) not in removed for dir_name in dirs):
+                    continue
+                try:
+                    if not self.dry_run:
+                        os.rmdir(root)
+                except OSError:
+                    continue
+                removed.add(root)
+                removed_count += 1
+                self.logger.info("Removed empty directory: %s", root)
         
         if removed_count > 0:
             console.print(f"[green]✅ Removed {removed_count} empty folders[/green]")
@@ -682,23 +873,45 @@ class EnhancedAutoClean:
         except KeyboardInterrupt:
             console.print("\n[yellow]⚠️ Operation cancelled by user[/yellow]")
         except Exception as e:
-            console.print(f"\n[bold red]❌ Error: {e}[/bold red]")
-            self.logger.error(f"Unexpected error: {e}", exc_info=True)
+            console.print(f"\n❌ Error: {e}", style="bold red", highlight=False, markup=False, soft_wrap=True)
+            self.logger.error("Unexpected error: %s", e, exc_info=True)
 
-def get_common_folders():
-    """Get common folders that users typically want to organize"""
+@functools.lru_cache(maxsize=1)
+def get_common_folders() -> Dict[str, Path]:
+    """Get common folders that users typically want to organize (cached; callers must not mutate)"""
     home = Path.home()
     common_folders = {
-        'downloads': home / 'Downloads',
-        'desktop': home / 'Desktop', 
-        'documents': home / 'Documents',
-        'pictures': home / 'Pictures',
-        'videos': home / 'Videos',
-        'music': home / 'Music'
+        'downloads': 'Downloads',
+        'desktop': 'Desktop',
+        'documents': 'Documents',
+        'pictures': 'Pictures',
+        'videos': 'Videos',
+        'music': 'Music'
     }
     
+    # One directory listing of home instead of a stat per candidate
+    try:
+        with os.scandir(home) as it:
+            present = {entry.name for entry in it if entry.is_dir()}
+    except OSError:
+        return {}
+    
     # Return only existing folders
-    return {name: path for name, path in common_folders.items() if path.exists()}
+    return {name: home / dir_name for name, dir_name in common_folders.items() if dir_name in present}
+
+def quick_file_count(path: Path, cap: int = 500) -> str:
+    """Label for the number of files in path, giving up after cap entries"""
+    n_files = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    n_files += 1
+                    if n_files > cap:
+                        return f">{cap}"
+    except OSError:
+        return "?"
+    return str(n_files)
 
 def interactive_folder_selection():
     """Interactive folder selection if no folders provided"""
@@ -712,7 +925,7 @@ def interactive_folder_selection():
     
     choices = []
     for name, path in common_folders.items():
-        file_count = len([f for f in path.iterdir() if f.is_file()]) if path.exists() else 0
+        file_count = quick_file_count(path)
         choices.append({
             'name': f"{name.title()} ({path}) - {file_count} files",
             'value': str(path)
@@ -744,11 +957,23 @@ def interactive_folder_selection():
         # Fallback if questionary not available
         console.print("Available folders:")
         for i, (name, path) in enumerate(common_folders.items(), 1):
-            file_count = len([f for f in path.iterdir() if f.is_file()]) if path.exists() else 0
-            console.print(f"  {i}. {name.title()} ({path}) - {file_count} files")
+            file_count = quick_file_count(path)
+            console.print(
+                f"  {i}. {name.title()} ({path}) - {file_count} files", highlight=False, markup=False, soft_wrap=True
+            )
         
         return [str(common_folders['downloads'])] if 'downloads' in common_folders else []
 
+def positive_int(value: str) -> int:
+    """argparse type for thread counts and other values that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 def main():
     """Main CLI entry point"""
     parser = argparse.ArgumentParser(
@@ -801,6 +1026,28 @@ Examples:
         help="Set logging level"
     )
     
+    parser.add_argument(
+        "--stat-threads",
+        type=positive_int,
+        default=None,
+        metavar="N",
+        help="Number of threads used to read file metadata while scanning"
+    )
+    
+    parser.add_argument(
+        "--threads",
+        type=positive_int,
+        default=None,
+        metavar="N",
+        help="Number of threads used to move files while organizing"
+    )
+    
+    parser.add_argument(
+        "--resolve-symlinks",
+        action="store_true",
+        help="Resolve symlinks in folder paths before organizing"
+    )
+    
     args = parser.parse_args()
     
     # Handle folder selection
@@ -814,16 +1061,16 @@ Examples:
             return
     
     # Handle common folder shortcuts
-    common_folders = get_common_folders()
-    resolved_folders = []
+    shortcuts = {name: str(path) for name, path in get_common_folders().items()}
+    resolved_folders = [shortcuts.get(folder.lower(), folder) for folder in folders]
     
     for folder in folders:
         folder_lower = folder.lower()
-        if folder_lower in common_folders:
-            resolved_folders.append(str(common_folders[folder_lower]))
-            console.print(f"[green]✅ Using {folder_lower}: {common_folders[folder_lower]}[/green]")
-        else:
-            resolved_folders.append(folder)
+        if folder_lower in shortcuts:
+            console.print(
+                f"✅ Using {folder_lower}: {shortcuts[folder_lower]}",
+                style="green", highlight=False, markup=False, soft_wrap=True
+            )
     
     # Create and run organizer
     organizer = EnhancedAutoClean(
@@ -832,7 +1079,10 @@ Examples:
         auto_organize=args.auto_organize,
         create_backup=not args.no_backup,
         delete_empty=args.delete_empty,
-        log_level=args.log_level
+        log_level=args.log_level,
+        stat_threads=args.stat_threads,
+        resolve_symlinks=args.resolve_symlinks,
+        move_threads=args.threads
     )
     
     organizer.run()